@@ -8,6 +8,8 @@ from aiida.orm import Data, Float, FolderData, Int, List, RemoteData, Singlefile
 from aiida_shell.calculations.shell import ShellJob
 from aiida_shell.data import EntryPointData, PickledData
 
+SUBMIT_SCRIPT_FILENAME = ShellJob.spec_metadata['options']['submit_script_filename'].default
+
 
 def custom_parser(self, dirpath):
     """Implement a custom parser to test the ``parser`` input for a ``ShellJob``."""
@@ -28,13 +30,13 @@ def test_code(generate_calc_job, generate_code):
     assert not list(dirpath.iterdir())
 
 
-def test_nodes_single_file_data(generate_calc_job, generate_code):
+def test_nodes_single_file_data(generate_calc_job, generate_code, sfd_content, list_tree):
     """Test the ``nodes`` input with ``SinglefileData`` nodes ."""
     inputs = {
         'code': generate_code(),
         'nodes': {
-            'xa': SinglefileData.from_string('content'),
-            'xb': SinglefileData.from_string('content'),
+            'xa': sfd_content,
+            'xb': sfd_content,
         },
     }
     dirpath, calc_info = generate_calc_job('core.shell', inputs)
@@ -44,17 +46,12 @@ def test_nodes_single_file_data(generate_calc_job, generate_code):
     assert code_info.stdout_name == ShellJob.FILENAME_STDOUT
     assert calc_info.retrieve_temporary_list == list(ShellJob.DEFAULT_RETRIEVED_TEMPORARY)
     assert sorted(calc_info.provenance_exclude_list) == ['xa', 'xb']
-    assert sorted([p.name for p in dirpath.iterdir()]) == ['xa', 'xb']
+    assert list_tree(dirpath) == {'xa', 'xb'}
 
 
-def test_nodes_folder_data(generate_calc_job, generate_code, tmp_path):
+def test_nodes_folder_data(generate_calc_job, generate_code, folder_pair, list_tree):
     """Test the ``nodes`` input with ``FolderData`` nodes ."""
-    (tmp_path / 'file_a.txt').write_text('content a')
-    (tmp_path / 'file_b.txt').write_text('content b')
-
-    folder_flat = FolderData(tree=tmp_path.absolute())
-    folder_nested = FolderData()
-    folder_nested.put_object_from_tree(tmp_path.absolute(), 'dir')
+    folder_flat, folder_nested = folder_pair
     inputs = {
         'code': generate_code(),
         'arguments': ['{nested}', '{nested_explicit}'],
@@ -73,10 +70,19 @@ def test_nodes_folder_data(generate_calc_job, generate_code, tmp_path):
     assert code_info.stdout_name == ShellJob.FILENAME_STDOUT
     assert calc_info.retrieve_temporary_list == list(ShellJob.DEFAULT_RETRIEVED_TEMPORARY)
     assert sorted(calc_info.provenance_exclude_list) == ['dir', 'file_a.txt', 'file_b.txt', 'sub']
-    assert sorted([p.name for p in dirpath.iterdir()]) == ['dir', 'file_a.txt', 'file_b.txt', 'sub']
-    assert sorted([p.name for p in (dirpath / 'dir').iterdir()]) == ['file_a.txt', 'file_b.txt']
-    assert sorted([p.name for p in (dirpath / 'sub').iterdir()]) == ['dir', 'file_a.txt', 'file_b.txt']
-    assert sorted([p.name for p in (dirpath / 'sub' / 'dir').iterdir()]) == ['file_a.txt', 'file_b.txt']
+    assert list_tree(dirpath) == {
+        'dir',
+        'dir/file_a.txt',
+        'dir/file_b.txt',
+        'file_a.txt',
+        'file_b.txt',
+        'sub',
+        'sub/dir',
+        'sub/dir/file_a.txt',
+        'sub/dir/file_b.txt',
+        'sub/file_a.txt',
+        'sub/file_b.txt',
+    }
     assert (dirpath / 'file_a.txt').read_text() == 'content a'
     assert (dirpath / 'file_b.txt').read_text() == 'content b'
 
@@ -121,7 +127,9 @@ def test_nodes_base_types(generate_calc_job, generate_code):
     assert calc_info.retrieve_temporary_list == list(ShellJob.DEFAULT_RETRIEVED_TEMPORARY)
 
 
-def test_nodes_single_file_data_filename(generate_calc_job, generate_code):
+def test_nodes_single_file_data_filename(
+    generate_calc_job, generate_code, sfd_content, sfd_content_named, list_tree
+):
     """Test the selection rules for the filename used for ``SinglefileData`` nodes.
 
     The filename is determined in the following order:
@@ -133,9 +141,9 @@ def test_nodes_single_file_data_filename(generate_calc_job, generate_code):
     inputs = {
         'code': generate_code(),
         'nodes': {
-            'xa': SinglefileData.from_string('content', filename='single_file_a'),
-            'xb': SinglefileData.from_string('content'),
-            'xc': SinglefileData.from_string('content'),
+            'xa': sfd_content_named,
+            'xb': sfd_content,
+            'xc': sfd_content,
         },
         'filenames': {
             'xb': 'filename_b',
@@ -147,7 +155,7 @@ def test_nodes_single_file_data_filename(generate_calc_job, generate_code):
     assert code_info.cmdline_params == []
     assert code_info.stdout_name == ShellJob.FILENAME_STDOUT
     assert calc_info.retrieve_temporary_list == list(ShellJob.DEFAULT_RETRIEVED_TEMPORARY)
-    assert sorted([p.name for p in dirpath.iterdir()]) == ['filename_b', 'single_file_a', 'xc']
+    assert list_tree(dirpath) == {'filename_b', 'single_file_a', 'xc'}
 
 
 @pytest.mark.parametrize(
@@ -185,20 +193,20 @@ def test_arguments(generate_calc_job, generate_code, arguments):
         assert code_info.cmdline_params == arguments
 
 
-def test_arguments_files(generate_calc_job, generate_code):
+def test_arguments_files(generate_calc_job, generate_code, sfd_content):
     """Test the ``arguments`` with placeholders for inputs."""
     arguments = List(['{file_a}'])
     inputs = {
         'code': generate_code(),
         'arguments': arguments,
-        'nodes': {'file_a': SinglefileData.from_string('content')},
+        'nodes': {'file_a': sfd_content},
     }
     _, calc_info = generate_calc_job('core.shell', inputs)
     code_info = calc_info.codes_info[0]
     assert code_info.cmdline_params == ['file_a']
 
 
-def test_arguments_files_filenames(generate_calc_job, generate_code):
+def test_arguments_files_filenames(generate_calc_job, generate_code, sfd_content):
     """Test the ``arguments`` with placeholders for files and explicit filenames.
 
     Nested directories should be created automatically.
@@ -208,8 +216,8 @@ def test_arguments_files_filenames(generate_calc_job, generate_code):
         'code': generate_code(),
         'arguments': arguments,
         'nodes': {
-            'file_a': SinglefileData.from_string('content'),
-            'file_b': SinglefileData.from_string('content'),
+            'file_a': sfd_content,
+            'file_b': sfd_content,
         },
         'filenames': {
             'file_a': 'custom_filename',
@@ -221,21 +229,22 @@ def test_arguments_files_filenames(generate_calc_job, generate_code):
     assert code_info.cmdline_params == ['custom_filename']
 
 
-def test_filename_stdin(generate_calc_job, generate_code, file_regression):
+def test_filename_stdin(generate_calc_job, generate_code, sfd_content):
     """Test the ``metadata.options.filename_stdin`` input."""
+    code = generate_code('cat')
     inputs = {
-        'code': generate_code('cat'),
+        'code': code,
         'arguments': List(['{filename}']),
-        'nodes': {'filename': SinglefileData.from_string('content')},
+        'nodes': {'filename': sfd_content},
         'metadata': {'options': {'filename_stdin': 'filename'}},
     }
     tmp_path, calc_info = generate_calc_job('core.shell', inputs, presubmit=True)
     code_info = calc_info.codes_info[0]
     assert code_info.stdin_name == 'filename'
 
-    options = ShellJob.spec_metadata['options']
-    filename_submit_script = options['submit_script_filename'].default
-    file_regression.check((pathlib.Path(tmp_path) / filename_submit_script).read_text(), encoding='utf-8')
+    submit_script = (pathlib.Path(tmp_path) / SUBMIT_SCRIPT_FILENAME).read_text()
+    assert f"'{code.get_executable()}' < 'filename' > 'stdout' 2> 'stderr'" in submit_script
+    assert 'echo $? > status' in submit_script
 
 
 @pytest.mark.parametrize('redirect_stderr', (True, False, None))
@@ -255,18 +264,14 @@ def test_redirect_stderr(generate_calc_job, generate_code, redirect_stderr):
         assert code_info.stderr_name == ShellJob.FILENAME_STDERR
 
 
-@pytest.mark.parametrize(
-    'outputs, message',
-    (
-        ([ShellJob.FILENAME_STATUS], r'`.*` is a reserved output filename and cannot be used in `outputs`.'),
-        ([ShellJob.FILENAME_STDERR], r'`.*` is a reserved output filename and cannot be used in `outputs`.'),
-        ([ShellJob.FILENAME_STDOUT], r'`.*` is a reserved output filename and cannot be used in `outputs`.'),
-    ),
-)
-def test_validate_outputs(generate_calc_job, generate_code, outputs, message):
+def test_validate_outputs(generate_calc_job, generate_code):
     """Test the validator for the ``outputs`` argument."""
-    with pytest.raises(ValueError, match=message):
-        generate_calc_job('core.shell', {'code': generate_code(), 'outputs': outputs})
+    code = generate_code()
+    message = r'`.*` is a reserved output filename and cannot be used in `outputs`.'
+
+    for filename in (ShellJob.FILENAME_STATUS, ShellJob.FILENAME_STDERR, ShellJob.FILENAME_STDOUT):
+        with pytest.raises(ValueError, match=message):
+            generate_calc_job('core.shell', {'code': code, 'outputs': [filename]})
 
 
 @pytest.mark.parametrize(
@@ -293,19 +298,18 @@ def test_validate_nodes(generate_calc_job, generate_code, node_cls, message, mon
         generate_calc_job('core.shell', {'code': generate_code(), 'nodes': nodes})
 
 
-@pytest.mark.parametrize(
-    'arguments, message',
-    (
+def test_validate_arguments(generate_calc_job, generate_code):
+    """Test the validator for the ``arguments`` argument."""
+    code = generate_code()
+
+    for arguments, message in (
         (['string', 1], r'.*all elements of the `arguments` input should be strings'),
         (['string', {input}], r'.*all elements of the `arguments` input should be strings'),
         (['<', '{filename}'], r'`<` cannot be specified in the `arguments`.*'),
         (['{filename}', '>'], r'the symbol `>` cannot be specified in the `arguments`.*'),
-    ),
-)
-def test_validate_arguments(generate_calc_job, generate_code, arguments, message):
-    """Test the validator for the ``arguments`` argument."""
-    with pytest.raises(ValueError, match=message):
-        generate_calc_job('core.shell', {'code': generate_code(), 'arguments': arguments})
+    ):
+        with pytest.raises(ValueError, match=message):
+            generate_calc_job('core.shell', {'code': code, 'arguments': arguments})
 
 
 def test_build_process_label(generate_calc_job, generate_code):
@@ -317,6 +321,7 @@ def test_build_process_label(generate_calc_job, generate_code):
     assert process._build_process_label() == f'ShellJob<{code.full_label}>'
 
 
+@pytest.mark.daemon
 def test_submit_to_daemon(generate_code, submit_and_await):
     """Test submitting a ``ShellJob`` to the daemon."""
     builder = generate_code('echo').get_builder()
@@ -357,6 +362,7 @@ def test_parser_invalid_signature(generate_calc_job, generate_code):
         generate_calc_job('core.shell', inputs={'code': generate_code(), 'parser': lambda x: x})
 
 
+@pytest.mark.daemon
 def test_parser_over_daemon(generate_code, submit_and_await):
     """Test submitting a ``ShellJob`` with a custom parser over the daemon."""
     value = 'testing'
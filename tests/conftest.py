@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import collections
+import functools
 import pathlib
 import tempfile
 import typing as t
@@ -16,7 +17,7 @@ from aiida.engine import CalcJob
 from aiida.engine.daemon.client import DaemonClient, DaemonNotRunningException, DaemonTimeoutException
 from aiida.engine.utils import instantiate_process
 from aiida.manage.manager import get_manager
-from aiida.orm import CalcJobNode, Computer, FolderData
+from aiida.orm import CalcJobNode, Computer, FolderData, SinglefileData
 from aiida.plugins import CalculationFactory, ParserFactory
 from aiida_shell import ShellCode
 
@@ -152,7 +153,7 @@ def generate_calc_job_node(generate_computer):
     return factory
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def generate_computer():
     """Return a :class:`aiida.orm.Computer` instance, either already existing or created."""
 
@@ -180,11 +181,15 @@ def generate_computer():
     return factory
 
 
-@pytest.fixture
-def generate_code(generate_computer):
-    """Return a :class:`aiida_shell.data.code.ShellCode` instance, either already existing or created."""
+@pytest.fixture(scope='session')
+def _generate_code_cached(generate_computer):
+    """Return a memoized factory that creates :class:`aiida_shell.data.code.ShellCode` instances.
 
-    def factory(command='/bin/true', computer_label='localhost', label=None, entry_point_name='core.shell'):
+    A code is only created once per unique combination of arguments for the entire test session.
+    """
+
+    @functools.lru_cache(maxsize=None)
+    def factory(command, computer_label, label, entry_point_name):
         """Return a :class:`aiida_shell.data.code.ShellCode` instance, either already existing or created."""
         label = label or str(uuid.uuid4())
         computer = generate_computer(computer_label)
@@ -207,6 +212,28 @@ def generate_code(generate_computer):
     return factory
 
 
+@pytest.fixture
+def generate_code(_generate_code_cached):
+    """Return a :class:`aiida_shell.data.code.ShellCode` instance, either already existing or created.
+
+    Codes are cached for the duration of the test session, so calling the factory multiple times with the same
+    arguments returns the same node. If the node no longer exists, for example because the storage was cleaned by the
+    ``aiida_profile_clean`` fixture, the cache is cleared and the code is recreated.
+    """
+
+    def factory(command='/bin/true', computer_label='localhost', label=None, entry_point_name='core.shell'):
+        """Return a :class:`aiida_shell.data.code.ShellCode` instance, either already existing or created."""
+        code = _generate_code_cached(command, computer_label, label, entry_point_name)
+
+        if not ShellCode.collection.count(filters={'uuid': code.uuid}):
+            _generate_code_cached.cache_clear()
+            code = _generate_code_cached(command, computer_label, label, entry_point_name)
+
+        return code
+
+    return factory
+
+
 @pytest.fixture(scope='session')
 def generate_parser():
     """Load and return a :class:`aiida.parsers.Parser` from an entry point."""
@@ -220,3 +247,54 @@ def generate_parser():
         return ParserFactory(entry_point_name)
 
     return factory
+
+
+@pytest.fixture(scope='session')
+def folder_pair(tmp_path_factory):
+    """Return a tuple of two stored :class:`aiida.orm.FolderData` nodes with the same files, one flat and one nested.
+
+    The first node contains the files ``file_a.txt`` and ``file_b.txt`` at its root, whereas the second node contains
+    them in the ``dir`` subdirectory. The nodes are created once for the entire test session.
+    """
+    dirpath = tmp_path_factory.mktemp('folder_src')
+    (dirpath / 'file_a.txt').write_text('content a')
+    (dirpath / 'file_b.txt').write_text('content b')
+
+    folder_flat = FolderData(tree=dirpath.absolute())
+    folder_nested = FolderData()
+    folder_nested.put_object_from_tree(dirpath.absolute(), 'dir')
+
+    return folder_flat.store(), folder_nested.store()
+
+
+@pytest.fixture(scope='session')
+def sfd_content():
+    """Return a stored :class:`aiida.orm.SinglefileData` with the content ``content`` and the default filename.
+
+    The node is created once for the entire test session.
+    """
+    return SinglefileData.from_string('content').store()
+
+
+@pytest.fixture(scope='session')
+def sfd_content_named():
+    """Return a stored :class:`aiida.orm.SinglefileData` with the content ``content`` and filename ``single_file_a``.
+
+    The node is created once for the entire test session.
+    """
+    return SinglefileData.from_string('content', filename='single_file_a').store()
+
+
+@pytest.fixture(scope='session')
+def list_tree():
+    """Return the set of relative filepaths of all files and directories contained in a directory."""
+
+    def factory(dirpath: pathlib.Path) -> set[str]:
+        """Return the set of relative filepaths of all files and directories contained in a directory.
+
+        :param dirpath: The directory to list recursively.
+        :returns: Set of POSIX filepaths relative to ``dirpath``.
+        """
+        return {filepath.relative_to(dirpath).as_posix() for filepath in dirpath.rglob('*')}
+
+    return factory